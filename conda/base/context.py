@@ -926,7 +926,7 @@ class Context(Configuration):
             )
         }
 
-    @property
+    @memoizedproperty
     def channels(self):
         local_add = ("local",) if self.use_local else ()
         if (
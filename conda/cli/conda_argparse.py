@@ -15,6 +15,7 @@ from argparse import ArgumentParser as ArgumentParserBase
 from importlib import import_module
 from logging import getLogger
 from subprocess import Popen
+from typing import TYPE_CHECKING
 
 from .. import __version__
 from ..auxlib.compat import isiterable
@@ -45,25 +46,9 @@ from .helpers import (  # noqa: F401
     add_parser_update_modifiers,
     add_parser_verbose,
 )
-from .main_clean import configure_parser as configure_parser_clean
-from .main_compare import configure_parser as configure_parser_compare
-from .main_config import configure_parser as configure_parser_config
-from .main_create import configure_parser as configure_parser_create
-from .main_env import configure_parser as configure_parser_env
-from .main_export import configure_parser as configure_parser_export
-from .main_info import configure_parser as configure_parser_info
-from .main_init import configure_parser as configure_parser_init
-from .main_install import configure_parser as configure_parser_install
-from .main_list import configure_parser as configure_parser_list
-from .main_mock_activate import configure_parser as configure_parser_mock_activate
-from .main_mock_deactivate import configure_parser as configure_parser_mock_deactivate
-from .main_notices import configure_parser as configure_parser_notices
-from .main_package import configure_parser as configure_parser_package
-from .main_remove import configure_parser as configure_parser_remove
-from .main_rename import configure_parser as configure_parser_rename
-from .main_run import configure_parser as configure_parser_run
-from .main_search import configure_parser as configure_parser_search
-from .main_update import configure_parser as configure_parser_update
+
+if TYPE_CHECKING:
+    from typing import Any
 
 log = getLogger(__name__)
 
@@ -93,6 +78,40 @@ BUILTIN_COMMANDS = {
     "notices",
 }
 
+#: Modules implementing the built-in commands (and any extra keyword arguments for their
+#: ``configure_parser``), imported on demand by :func:`generate_parser`
+_BUILTIN_PARSERS = (
+    ("main_mock_activate", {}),
+    ("main_mock_deactivate", {}),
+    ("main_clean", {}),
+    ("main_compare", {}),
+    ("main_config", {}),
+    ("main_create", {}),
+    ("main_env", {}),
+    ("main_export", {}),
+    ("main_info", {}),
+    ("main_init", {}),
+    ("main_install", {}),
+    ("main_list", {}),
+    ("main_notices", {}),
+    ("main_package", {}),
+    ("main_remove", {"aliases": ("uninstall",)}),
+    ("main_rename", {}),
+    ("main_run", {}),
+    ("main_search", {}),
+    ("main_update", {"aliases": ("upgrade",)}),
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the ``configure_parser_*`` aliases for the built-in commands."""
+    prefix = "configure_parser_"
+    if name.startswith(prefix):
+        module_name = f"main_{name[len(prefix):]}"
+        if module_name in dict(_BUILTIN_PARSERS):
+            return import_module(f".{module_name}", __package__).configure_parser
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 def generate_pre_parser(**kwargs) -> ArgumentParser:
     pre_parser = ArgumentParser(
@@ -138,25 +157,9 @@ def generate_parser(**kwargs) -> ArgumentParser:
         required=True,
     )
 
-    configure_parser_mock_activate(sub_parsers)
-    configure_parser_mock_deactivate(sub_parsers)
-    configure_parser_clean(sub_parsers)
-    configure_parser_compare(sub_parsers)
-    configure_parser_config(sub_parsers)
-    configure_parser_create(sub_parsers)
-    configure_parser_env(sub_parsers)
-    configure_parser_export(sub_parsers)
-    configure_parser_info(sub_parsers)
-    configure_parser_init(sub_parsers)
-    configure_parser_install(sub_parsers)
-    configure_parser_list(sub_parsers)
-    configure_parser_notices(sub_parsers)
-    configure_parser_package(sub_parsers)
-    configure_parser_remove(sub_parsers, aliases=["uninstall"])
-    configure_parser_rename(sub_parsers)
-    configure_parser_run(sub_parsers)
-    configure_parser_search(sub_parsers)
-    configure_parser_update(sub_parsers, aliases=["upgrade"])
+    for module_name, parser_kwargs in _BUILTIN_PARSERS:
+        module = import_module(f".{module_name}", __package__)
+        module.configure_parser(sub_parsers, **parser_kwargs)
     configure_parser_plugins(sub_parsers)
 
     return parser
@@ -503,6 +503,21 @@ def add_parser_known(p: ArgumentParser) -> None:
     )
 
 
+def add_parser_dev(p: ArgumentParser) -> None:
+    from ..common.constants import NULL
+    from .actions import NullCountAction
+
+    p.add_argument(
+        "--dev",
+        action=NullCountAction,
+        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
+        "This is mainly for use during tests where we test new conda sources "
+        "against old Python versions.",
+        dest="dev",
+        default=NULL,
+    )
+
+
 def add_parser_default_packages(p: ArgumentParser) -> None:
     p.add_argument(
         "--no-default-packages",
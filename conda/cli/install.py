@@ -234,7 +234,7 @@ def install(args, parser, command="install"):
     args_packages = [s.strip("\"'") for s in args.packages]
     if newenv and not args.no_default_packages:
         # Override defaults if they are specified at the command line
-        names = [MatchSpec(pkg).name for pkg in args_packages]
+        names = {MatchSpec(pkg).name for pkg in args_packages}
         for default_package in context.create_default_packages:
             if MatchSpec(default_package).name not in names:
                 args_packages.append(default_package)
@@ -68,8 +68,9 @@ def main_subshell(*args, post_parse_hook=None, **kwargs):
     if context.no_plugins:
         context.plugin_manager.disable_external_plugins()
 
-    # reinitialize in case any of the entrypoints modified the context
-    context.__init__(argparse_args=pre_args)
+        # reinitialize in case any of the entrypoints modified the context, otherwise
+        # the entrypoints aren't loaded until the parser is generated below
+        context.__init__(argparse_args=pre_args)
 
     parser = generate_parser(add_help=True)
     args = parser.parse_args(args, override_args=override_args, namespace=pre_args)
@@ -112,13 +113,23 @@ def main_sourced(shell, *args, **kwargs):
 
 
 def main(*args, **kwargs):
-    # conda.common.compat contains only stdlib imports
-    from ..common.compat import ensure_text_type
-    from ..exception_handler import conda_exception_handler
-
     # cleanup argv
-    args = args or sys.argv[1:]  # drop executable/script
-    args = tuple(ensure_text_type(s) for s in args)
+    args = tuple(args or sys.argv[1:])  # drop executable/script
+    if any(isinstance(arg, bytes) for arg in args):
+        # conda.common.compat contains only stdlib imports
+        from ..common.compat import ensure_text_type
+
+        args = tuple(ensure_text_type(s) for s in args)
+
+    # argparse prints the version and exits as soon as it encounters the flag, emulate
+    # that here so `conda --version` doesn't initialize the context or build the parser
+    if args and args[0] in ("-V", "--version"):
+        from .. import __version__
+
+        print(f"conda {__version__}")
+        return 0
+
+    from ..exception_handler import conda_exception_handler
 
     if args and args[0].strip().startswith("shell."):
         main = main_sourced
@@ -23,11 +23,10 @@ log = getLogger(__name__)
 
 def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser:
     from ..auxlib.ish import dals
-    from ..common.constants import NULL
-    from .actions import NullCountAction
     from .helpers import (
         add_parser_create_install_update,
         add_parser_default_packages,
+        add_parser_dev,
         add_parser_platform,
         add_parser_solver,
     )
@@ -82,15 +81,7 @@ def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser
             addendum="Redundant argument.",
         ),
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
+    add_parser_dev(p)
     p.set_defaults(func="conda.cli.main_create.execute")
 
     return p
@@ -5,24 +5,27 @@
 from __future__ import annotations
 
 from argparse import ArgumentParser
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 from ..deprecations import deprecated
-from . import main_export
 
 if TYPE_CHECKING:
     from argparse import Namespace, _SubParsersAction
 
+#: Modules implementing the `conda env` subcommands, imported on demand by
+#: :func:`configure_parser`
+_ENV_PARSERS = (
+    "main_env_config",
+    "main_env_create",
+    "main_export",
+    "main_env_list",
+    "main_env_remove",
+    "main_env_update",
+)
 
-def configure_parser(sub_parsers: _SubParsersAction | None, **kwargs) -> ArgumentParser:
-    from . import (
-        main_env_config,
-        main_env_create,
-        main_env_list,
-        main_env_remove,
-        main_env_update,
-    )
 
+def configure_parser(sub_parsers: _SubParsersAction | None, **kwargs) -> ArgumentParser:
     # This is a backport for the deprecated `conda_env`, see `conda_env.cli.main`
     if sub_parsers is None:
         deprecated.topic(
@@ -42,12 +45,8 @@ def configure_parser(sub_parsers: _SubParsersAction | None, **kwargs) -> Argumen
         metavar="command",
         dest="cmd",
     )
-    main_env_config.configure_parser(env_parsers)
-    main_env_create.configure_parser(env_parsers)
-    main_export.configure_parser(env_parsers)
-    main_env_list.configure_parser(env_parsers)
-    main_env_remove.configure_parser(env_parsers)
-    main_env_update.configure_parser(env_parsers)
+    for module_name in _ENV_PARSERS:
+        import_module(f".{module_name}", __package__).configure_parser(env_parsers)
 
     p.set_defaults(func="conda.cli.main_env.execute")
     return p
@@ -11,6 +11,21 @@ from argparse import (
     _SubParsersAction,
 )
 
+# arguments overlaid onto the parsed `conda env remove` arguments so that they can be
+# handed to `conda remove --all`
+_REMOVE_ALL_ARGS = {
+    "all": True,
+    "channel": None,
+    "features": None,
+    "override_channels": None,
+    "use_local": None,
+    "use_cache": None,
+    "offline": None,
+    "force": True,
+    "pinned": None,
+    "keep_env": False,
+}
+
 
 def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser:
     from ..auxlib.ish import dals
@@ -61,24 +76,11 @@ def execute(args: Namespace, parser: ArgumentParser) -> int:
     from ..base.context import context
     from ..cli.main_remove import execute as remove
 
-    args = vars(args)
-    args.update(
-        {
-            "all": True,
-            "channel": None,
-            "features": None,
-            "override_channels": None,
-            "use_local": None,
-            "use_cache": None,
-            "offline": None,
-            "force": True,
-            "pinned": None,
-            "keep_env": False,
-        }
-    )
-    args = Namespace(**args)
+    args = Namespace(**{**vars(args), **_REMOVE_ALL_ARGS})
 
-    context.__init__(argparse_args=args)
+    # the overrides leave --name/--prefix untouched so the search path (and the condarc
+    # files loaded from it) stays the same; only refresh the command line arguments
+    context._set_argparse_args(args)
 
     remove(args, parser)
 
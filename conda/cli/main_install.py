@@ -21,9 +21,9 @@ if TYPE_CHECKING:
 def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser:
     from ..auxlib.ish import dals
     from ..common.constants import NULL
-    from .actions import NullCountAction
     from .helpers import (
         add_parser_create_install_update,
+        add_parser_dev,
         add_parser_prune,
         add_parser_solver,
         add_parser_update_modifiers,
@@ -120,15 +120,7 @@ def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser
         help="Allow clobbering (i.e. overwriting) of overlapping file paths "
         "within packages and suppress related warnings.",
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
+    add_parser_dev(p)
     p.set_defaults(func="conda.cli.main_install.execute")
 
     return p
@@ -17,10 +17,10 @@ log = logging.getLogger(__name__)
 def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser:
     from ..auxlib.ish import dals
     from ..common.constants import NULL
-    from .actions import NullCountAction
     from .helpers import (
         add_output_and_prompt_options,
         add_parser_channels,
+        add_parser_dev,
         add_parser_networking,
         add_parser_prefix,
         add_parser_prune,
@@ -124,15 +124,7 @@ def configure_parser(sub_parsers: _SubParsersAction, **kwargs) -> ArgumentParser
         nargs="*",
         help="Package names to remove from the environment.",
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
+    add_parser_dev(p)
 
     p.set_defaults(func="conda.cli.main_remove.execute")
 
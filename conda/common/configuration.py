@@ -21,7 +21,7 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from collections.abc import Mapping
 from enum import Enum, EnumMeta
-from functools import wraps
+from functools import cached_property, lru_cache, wraps
 from itertools import chain
 from logging import getLogger
 from os import environ
@@ -32,9 +32,6 @@ from string import Template
 from typing import TYPE_CHECKING
 
 from boltons.setutils import IndexedSet
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-from ruamel.yaml.reader import ReaderError
-from ruamel.yaml.scanner import ScannerError
 
 from .. import CondaError, CondaMultiError
 from ..auxlib.collection import AttrDict, first, last
@@ -248,7 +245,7 @@ class EnvRawParameter(RawParameter):
         else:
             return self.__important_split_value[0].strip()
 
-    @property
+    @cached_property
     def __important_split_value(self):
         return self._raw_value.split("!important")
 
@@ -296,6 +293,8 @@ class YamlRawParameter(RawParameter):
     # this class should encapsulate all direct use of ruamel.yaml in this module
 
     def __init__(self, source, key, raw_value, key_comment):
+        from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
         self._key_comment = key_comment
         super().__init__(source, key, raw_value)
 
@@ -394,23 +393,34 @@ class YamlRawParameter(RawParameter):
     @classmethod
     def make_raw_parameters_from_file(cls, filepath):
         with open(filepath) as fh:
-            try:
-                yaml_obj = yaml_round_trip_load(fh)
-            except ScannerError as err:
-                mark = err.problem_mark
-                raise ConfigurationLoadError(
-                    filepath,
-                    "  reason: invalid yaml at line %(line)s, column %(column)s",
-                    line=mark.line,
-                    column=mark.column,
-                )
-            except ReaderError as err:
-                raise ConfigurationLoadError(
-                    filepath,
-                    "  reason: invalid yaml at position %(position)s",
-                    position=err.position,
-                )
-            return cls.make_raw_parameters(filepath, yaml_obj) or EMPTY_MAP
+            return cls._make_raw_parameters_from_text(filepath, fh.read())
+
+    @classmethod
+    # FUTURE: Python 3.9+, replace with functools.cache
+    @lru_cache(maxsize=None)
+    def _make_raw_parameters_from_text(cls, filepath, text):
+        # the search path is reloaded every time the context is initialized (several times
+        # per command), keying on the file's contents means we only parse it once per change
+        from ruamel.yaml.reader import ReaderError
+        from ruamel.yaml.scanner import ScannerError
+
+        try:
+            yaml_obj = yaml_round_trip_load(text)
+        except ScannerError as err:
+            mark = err.problem_mark
+            raise ConfigurationLoadError(
+                filepath,
+                "  reason: invalid yaml at line %(line)s, column %(column)s",
+                line=mark.line,
+                column=mark.column,
+            )
+        except ReaderError as err:
+            raise ConfigurationLoadError(
+                filepath,
+                "  reason: invalid yaml at position %(position)s",
+                position=err.position,
+            )
+        return cls.make_raw_parameters(filepath, yaml_obj) or EMPTY_MAP
 
 
 class DefaultValueRawParameter(RawParameter):
@@ -1246,14 +1256,17 @@ class ParameterLoader:
         # strategy is "extract and merge," which is actually just map and reduce
         # extract matches from each source in SEARCH_PATH
         # then merge matches together
-        if self.name in instance._cache_:
-            return instance._cache_[self.name]
+        name = self.name
+        try:
+            return instance._cache_[name]
+        except KeyError:
+            pass
 
         # step 1/2: load config and find top level matches
-        raw_matches, errors = self.type.get_all_matches(self.name, self.names, instance)
+        raw_matches, errors = self.type.get_all_matches(name, self.names, instance)
 
         # step 3: parse RawParameters into LoadedParameters
-        matches = [self.type.load(self.name, match) for match in raw_matches]
+        matches = [self.type.load(name, match) for match in raw_matches]
 
         # step 4: merge matches
         merged = matches[0].merge(matches) if matches else self.type.default
@@ -1269,7 +1282,7 @@ class ParameterLoader:
         else:
             errors.extend(expanded.collect_errors(instance, result, "<<merged>>"))
         raise_errors(errors)
-        instance._cache_[self.name] = result
+        instance._cache_[name] = result
         return result
 
     def _raw_parameters_from_single_source(self, raw_parameters):
@@ -1369,7 +1382,7 @@ def custom_expandvars(
 class Configuration(metaclass=ConfigurationType):
     def __init__(self, search_path=(), app_name=None, argparse_args=None, **kwargs):
         # Currently, __init__ does a **full** disk reload of all files.
-        # A future improvement would be to cache files that are already loaded.
+        # Files whose contents haven't changed aren't parsed again (see YamlRawParameter).
         self.raw_data = {}
         self._cache_ = {}
         self._reset_callbacks = IndexedSet()
@@ -7,16 +7,25 @@ import json
 from io import StringIO
 from logging import getLogger
 
-import ruamel.yaml as yaml
-
 from ..auxlib.entity import EntityEncoder
 
 log = getLogger(__name__)
 
 
+def __getattr__(name):
+    # ruamel.yaml is only imported once YAML is actually (de)serialized
+    if name == "yaml":
+        import ruamel.yaml
+
+        return ruamel.yaml
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 # FUTURE: Python 3.9+, replace with functools.cache
 @functools.lru_cache(maxsize=None)
 def _yaml_round_trip():
+    import ruamel.yaml as yaml
+
     parser = yaml.YAML(typ="rt")
     parser.indent(mapping=2, offset=2, sequence=4)
     return parser
@@ -25,6 +34,8 @@ def _yaml_round_trip():
 # FUTURE: Python 3.9+, replace with functools.cache
 @functools.lru_cache(maxsize=None)
 def _yaml_safe():
+    import ruamel.yaml as yaml
+
     parser = yaml.YAML(typ="safe", pure=True)
     parser.indent(mapping=2, offset=2, sequence=4)
     parser.default_flow_style = False
@@ -998,7 +998,7 @@ class Solver:
             ssc.r.get_conflicting_specs(
                 tuple(final_environment_specs), self.specs_to_add
             )
-            or []
+            or ()
         )
         while conflicting_specs:
             specs_modified = False
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 from ..base.constants import NOTICES_DECORATOR_DISPLAY_INTERVAL, NOTICES_FN
 from ..base.context import context
 from ..models.channel import get_channel_objs
-from . import cache, fetch, views
+from . import cache, views
 from .types import ChannelNoticeResultSet
 
 if TYPE_CHECKING:
@@ -44,6 +44,10 @@ def retrieve_notices(
                             (defaults to True).
         silent: Whether to use a spinner when fetching and caching notices.
     """
+    # deferred so that importing the `notices` decorator (i.e. every time the parser
+    # is generated) doesn't import the connection stack
+    from . import fetch
+
     channel_name_urls = get_channel_name_and_urls(get_channel_objs(context))
     channel_notice_responses = fetch.get_notice_responses(
         channel_name_urls, silent=silent
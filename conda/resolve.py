@@ -346,8 +346,8 @@ class Resolve:
             "direct": set(),
             "virtual_package": set(),
         }
-        specs_to_add = {MatchSpec(_) for _ in specs_to_add or []}
-        history_specs = {MatchSpec(_) for _ in history_specs or []}
+        specs_to_add = {MatchSpec(_) for _ in specs_to_add or ()}
+        history_specs = {MatchSpec(_) for _ in history_specs or ()}
         for chain in bad_deps:
             # sometimes chains come in as strings
             if (
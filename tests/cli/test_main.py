@@ -24,3 +24,17 @@ def test_ensure_no_command_provided_returns_help(
     captured = capsys.readouterr()
 
     assert "error: the following arguments are required: COMMAND" in captured.err
+
+
+@pytest.mark.parametrize("option", ("-V", "--version"))
+def test_version(conda_cli: CondaCLIFixture, capsys, option):
+    """`conda.cli.main.main` fast path must match the output of the argparse version action."""
+    from conda.cli.main import main
+
+    assert main(option) == 0
+    fast = capsys.readouterr()
+
+    stdout, stderr, err = conda_cli(option, raises=SystemExit)
+    assert fast.out == stdout
+    assert fast.err == stderr == ""
+    assert err.value.code == 0
@@ -689,6 +689,22 @@ def test_config_resets():
         assert config.changeps1 is False
 
 
+def test_file_config_resets(tmp_path: Path):
+    condarc = tmp_path / ".condarc"
+    condarc.write_text("changeps1: false\n")
+    config = SampleConfiguration([condarc])
+    assert config.changeps1 is False
+
+    # unchanged files are not parsed again
+    raw_data = config.raw_data[condarc]
+    config.__init__([condarc])
+    assert config.raw_data[condarc] is raw_data
+
+    condarc.write_text("changeps1: true\n")
+    config.__init__([condarc])
+    assert config.changeps1 is True
+
+
 def test_empty_map_parameter():
     config = SampleConfiguration()._set_raw_data(
         load_from_string_data("bad_boolean_map")